@@ -17,248 +17,31 @@ Calibrated to match:
 - Fleetwood-like large size: 24' x 12' with 0.30 BTU glass ≈ 0.32 BTU
 """
 
+from pathlib import Path
+
 import numpy as np
 import streamlit as st
 
-BTU_TO_W = 5.678  # BTU/hr·ft²·°F -> W/m²K
-
-def length_to_mm(value: float, unit: str) -> float:
-    """
-    Convert a length to mm.
-    unit: "mm", "m", "ft", "in"
-    """
-    unit = unit.lower()
-    if unit == "mm":
-        return value
-    if unit == "m":
-        return value * 1000.0
-    if unit == "ft":
-        return value * 304.8
-    if unit == "in":
-        return value * 25.4
-    raise ValueError(f"Unsupported length unit: {unit}")
-
-def mm_to_length(value_mm: float, unit: str) -> float:
-    """
-    Convert a length from mm to specified unit.
-    unit: "mm", "m", "ft", "in"
-    """
-    unit = unit.lower()
-    if unit == "mm":
-        return value_mm
-    if unit == "m":
-        return value_mm / 1000.0
-    if unit == "ft":
-        return value_mm / 304.8
-    if unit == "in":
-        return value_mm / 25.4
-    raise ValueError(f"Unsupported length unit: {unit}")
-
-def u_to_metric(u_value: float, unit: str) -> float:
-    """
-    Convert U-value to W/m²K.
-    unit: "BTU" for BTU/hr·ft²·°F, "W" for W/m²K
-    """
-    unit = unit.upper()
-    if unit == "W":
-        return u_value
-    if unit == "BTU":
-        return u_value * BTU_TO_W
-    raise ValueError(f"Unsupported U-value unit: {unit}")
-
-def u_to_btu(u_value_metric: float) -> float:
-    """Convert U-value from W/m²K to BTU/hr·ft²·°F."""
-    return u_value_metric / BTU_TO_W
-
-def dynamic_frame_and_edge(width_mm: float, height_mm: float):
-    """
-    Estimate effective frame width and edge-of-glass zone thickness
-    as a function of size. Tuned empirically.
-    """
-    perimeter_mm = 2.0 * (width_mm + height_mm)
-
-    # Frame width grows slowly with size but stays in a realistic band
-    frame_width_mm = max(40.0, min(100.0, 0.015 * (perimeter_mm ** 0.5)))
-
-    # Edge zone (degraded glass near spacer) also scales mildly
-    edge_zone_mm = max(30.0, min(80.0, 0.010 * (perimeter_mm ** 0.5)))
-
-    return frame_width_mm, edge_zone_mm
-
-def solve_frame_and_edge_u(
-    U_glass1_metric: float,
-    U_total1_metric: float,
-    U_glass2_metric: float,
-    U_total2_metric: float,
-    A_glass: float,
-    A_frame: float,
-    A_edge: float,
-):
-    """
-    Solve for frame and edge U-values using two NFRC reference cases.
-
-    We assume the *area partition* (A_glass, A_frame, A_edge) for the base door
-    is representative of the system and use two total U-values with different
-    glass performance to solve for U_frame and U_edge.
-    """
-    A_total = A_glass + A_frame + A_edge
-
-    # System:
-    # U_total1 * A_total = A_g * U_g1 + A_f * U_f + A_e * U_e
-    # U_total2 * A_total = A_g * U_g2 + A_f * U_f + A_e * U_e
-    A = np.array([
-        [A_frame, A_edge],
-        [A_frame, A_edge]
-    ])
-    b = np.array([
-        U_total1_metric * A_total - U_glass1_metric * A_glass,
-        U_total2_metric * A_total - U_glass2_metric * A_glass,
-    ])
-
-    U_frame_metric, U_edge_metric = np.linalg.lstsq(A, b, rcond=None)[0]
-    return U_frame_metric, U_edge_metric
-
-def estimate_u_value(
-    width: float,
-    height: float,
-    size_unit: str,
-    glass_u: float,
-    glass_u_unit: str = "BTU",
-    panels: int = 2,
-    # NFRC reference data for a 2000 x 2000 mm door:
-    ref_glass_u1: float = 0.25,
-    ref_total_u1: float = 0.41,
-    ref_glass_u2: float = 0.30,
-    ref_total_u2: float = 0.46,
-    ref_u_unit: str = "BTU",
-    # Frame recess parameters:
-    recess_fraction: float = 0.0,   # 0.0 = no recess, 1.0 = fully recessed
-    recess_effectiveness: float = 0.6,  # how strongly recess lowers frame U
-):
-    """
-    Estimate assembly U-value for a glazed door.
-
-    width, height: numeric door size
-    size_unit: "mm", "m", "ft", "in"
-    glass_u: glazing U-value (center-of-glass)
-    glass_u_unit: "BTU" or "W"
-    panels: number of panels (if > 2, scales width only by 2/panels to get 2-panel equivalent)
-    ref_glass_u1, ref_total_u1: NFRC reference for ~2m x 2m door, better glass
-    ref_glass_u2, ref_total_u2: NFRC reference for ~2m x 2m door, worse glass
-    ref_u_unit: unit for the reference U-values ("BTU" or "W")
-    recess_fraction: fraction of frame embedded in wall (0–1)
-    recess_effectiveness: how much recess reduces frame U (0–1)
-
-    Returns:
-        dict with:
-            - U_metric (W/m²K)
-            - U_btu (BTU/hr·ft²·°F)
-            - areas (glass/frame/edge/total)
-            - intermediate U_frame / U_edge (metric)
-    """
-
-    # ---- 0. SCALE FOR MULTI-PANEL SYSTEMS ----
-    # IF MORE THAN 2 PANELS, SCALE WIDTH ONLY TO 2-PANEL EQUIVALENT
-    if panels > 2:
-        scale_factor = 2.0 / panels
-        width = width * scale_factor
-        # HEIGHT REMAINS UNCHANGED
-
-    # ---- 1. Convert sizes ----
-    width_mm = length_to_mm(width, size_unit)
-    height_mm = length_to_mm(height, size_unit)
-    width_m = width_mm / 1000.0
-    height_m = height_mm / 1000.0
-
-    # ---- 2. Convert U-values to metric ----
-    U_glass_metric = u_to_metric(glass_u, glass_u_unit)
-
-    U_glass1_metric = u_to_metric(ref_glass_u1, ref_u_unit)
-    U_total1_metric = u_to_metric(ref_total_u1, ref_u_unit)
-    U_glass2_metric = u_to_metric(ref_glass_u2, ref_u_unit)
-    U_total2_metric = u_to_metric(ref_total_u2, ref_u_unit)
-
-    # ---- 3. Geometry & areas ----
-    frame_width_mm, edge_zone_mm = dynamic_frame_and_edge(width_mm, height_mm)
-
-    A_total = (width_mm * height_mm) / 1e6  # mm² -> m²
-
-    A_glass = ((width_mm - 2 * frame_width_mm) *
-               (height_mm - 2 * frame_width_mm)) / 1e6
-
-    # Edge-of-glass annulus
-    A_edge = (
-        (width_mm - 2 * frame_width_mm + 2 * edge_zone_mm) *
-        (height_mm - 2 * frame_width_mm + 2 * edge_zone_mm)
-        -
-        (width_mm - 2 * frame_width_mm - 2 * edge_zone_mm) *
-        (height_mm - 2 * frame_width_mm - 2 * edge_zone_mm)
-    ) / 1e6
-    A_edge = max(0.0, A_edge)
-
-    A_frame = A_total - A_glass - A_edge
-
-    # Back-calc frame/edge U-values
-    U_frame_metric, U_edge_metric = solve_frame_and_edge_u(
-        U_glass1_metric, U_total1_metric,
-        U_glass2_metric, U_total2_metric,
-        A_glass, A_frame, A_edge
-    )
-
-    # ---- 4. Apply frame recess adjustment ----
-    recess_fraction = max(0.0, min(1.0, recess_fraction))
-    recess_effectiveness = max(0.0, min(1.0, recess_effectiveness))
-
-    U_frame_adj_metric = U_frame_metric * (1.0 - recess_fraction * recess_effectiveness)
-
-    # ---- 5. Area-weighted base U ----
-    U_weighted_metric = (
-        U_glass_metric * A_glass +
-        U_edge_metric * A_edge +
-        U_frame_adj_metric * A_frame
-    ) / A_total
-
-    # ---- 6. Non-linear size + aspect ratio correction ----
-    aspect_ratio = height_m / max(width_m, 1e-6)
-    size_factor = (width_mm * height_mm) / (2000.0 * 2000.0)  # vs 2m x 2m base
-
-    # Aspect ratio penalty
-    aspect_factor = 1.0 + 0.02 * abs(aspect_ratio - 1.0)
-
-    # Larger units perform better
-    size_factor_correction = np.exp(-0.06 * (size_factor - 1.0))
-
-    U_final_metric = U_weighted_metric * aspect_factor * size_factor_correction
-    U_final_btu = u_to_btu(U_final_metric)
-
-    return {
-        "U_metric": float(round(U_final_metric, 3)),
-        "U_btu": float(round(U_final_btu, 3)),
-
-        "areas_m2": {
-            "A_total": float(A_total),
-            "A_glass": float(A_glass),
-            "A_edge": float(A_edge),
-            "A_frame": float(A_frame),
-        },
-
-        "U_components_metric": {
-            "U_glass": float(U_glass_metric),
-            "U_edge": float(round(U_edge_metric, 3)),
-            "U_frame_raw": float(round(U_frame_metric, 3)),
-            "U_frame_adjusted": float(round(U_frame_adj_metric, 3)),
-        },
-
-        "debug": {
-            "aspect_ratio": float(aspect_ratio),
-            "size_factor": float(size_factor),
-            "frame_width_mm": float(frame_width_mm),
-            "edge_zone_mm": float(edge_zone_mm),
-            "scaled_width": float(width),
-            "scaled_height": float(height),
-            "panels": panels,
-        }
-    }
+# THE NUMERIC MODEL (INCLUDING THE NUMBA KERNELS) LIVES IN A SIDE-EFFECT-FREE
+# MODULE: NUMBA'S ON-DISK CACHE RE-IMPORTS THE DEFINING MODULE, WHICH MUST
+# NEVER BE THIS SCRIPT
+import uvalue_core
+from uvalue_core import (  # estimate_u_value RE-EXPORTED FOR EXTERNAL CALLERS
+    BTU_TO_W,
+    LENGTH_TO_MM,
+    U_TO_METRIC,
+    estimate_u_value,
+    estimate_u_value_sweep,
+    length_to_mm,
+    mm_to_length,
+    u_to_btu,
+    u_to_metric,
+)
+
+# CACHE SINGLE-DOOR RESULTS ACROSS RERUNS AND SESSIONS
+estimate_u_value_mm = st.cache_data(max_entries=256, show_spinner=False)(
+    uvalue_core.estimate_u_value_mm
+)
 
 
 # PRESETS FOR REFERENCE GLASS U-VALUES
@@ -298,35 +81,38 @@ def check_preset_match(ref_glass_u1_metric, ref_total_u1_metric, ref_glass_u2_me
 # STREAMLIT UI
 st.set_page_config(page_title="U-Value Estimator", layout="wide")
 
-# INITIALIZE SESSION STATE FOR UNIT CONVERSION
+# INITIALIZE SESSION STATE FOR UNIT CONVERSION (ONCE PER SESSION)
 # STORE VALUES IN BASE UNITS: mm FOR DIMENSIONS, W/m²K FOR U-VALUES
-if "width_mm" not in st.session_state:
-    st.session_state.width_mm = length_to_mm(12.0, "ft")  # DEFAULT 12FT
-if "height_mm" not in st.session_state:
-    st.session_state.height_mm = length_to_mm(9.0, "ft")  # DEFAULT 9FT
-if "glass_u_metric" not in st.session_state:
-    st.session_state.glass_u_metric = u_to_metric(0.30, "BTU")  # DEFAULT 0.30 BTU
-if "size_unit_prev" not in st.session_state:
-    st.session_state.size_unit_prev = "ft"
-if "glass_u_unit_prev" not in st.session_state:
-    st.session_state.glass_u_unit_prev = "BTU"
-# REFERENCE U-VALUES (STORED IN METRIC) - INITIALIZE TO CERO2 PRESET
-if "ref_glass_u1_metric" not in st.session_state:
-    st.session_state.ref_glass_u1_metric = u_to_metric(PRESETS["Cero2"]["ref_glass_u1"], "BTU")
-if "ref_total_u1_metric" not in st.session_state:
-    st.session_state.ref_total_u1_metric = u_to_metric(PRESETS["Cero2"]["ref_total_u1"], "BTU")
-if "ref_glass_u2_metric" not in st.session_state:
-    st.session_state.ref_glass_u2_metric = u_to_metric(PRESETS["Cero2"]["ref_glass_u2"], "BTU")
-if "ref_total_u2_metric" not in st.session_state:
-    st.session_state.ref_total_u2_metric = u_to_metric(PRESETS["Cero2"]["ref_total_u2"], "BTU")
-if "ref_u_unit_prev" not in st.session_state:
-    st.session_state.ref_u_unit_prev = "BTU"
-if "ref_u_unit" not in st.session_state:
-    st.session_state.ref_u_unit = "BTU"
-if "preset_selection_prev" not in st.session_state:
-    st.session_state.preset_selection_prev = "Cero2"  # DEFAULT PRESET
-if "current_preset" not in st.session_state:
-    st.session_state.current_preset = "Cero2"  # DEFAULT PRESET
+if "_initialized" not in st.session_state:
+    st.session_state.update({
+        "width_mm": 12.0 * 304.8,  # DEFAULT 12FT
+        "height_mm": 9.0 * 304.8,  # DEFAULT 9FT
+        "glass_u_metric": 0.30 * BTU_TO_W,  # DEFAULT 0.30 BTU
+        "size_unit_prev": "ft",
+        "glass_u_unit_prev": "BTU",
+        # REFERENCE U-VALUES (STORED IN METRIC) - INITIALIZE TO CERO2 PRESET
+        "ref_glass_u1_metric": PRESETS["Cero2"]["ref_glass_u1"] * BTU_TO_W,
+        "ref_total_u1_metric": PRESETS["Cero2"]["ref_total_u1"] * BTU_TO_W,
+        "ref_glass_u2_metric": PRESETS["Cero2"]["ref_glass_u2"] * BTU_TO_W,
+        "ref_total_u2_metric": PRESETS["Cero2"]["ref_total_u2"] * BTU_TO_W,
+        "ref_u_unit_prev": "BTU",
+        "ref_u_unit": "BTU",
+        "preset_selection_prev": "Cero2",  # DEFAULT PRESET
+        "current_preset": "Cero2",  # DEFAULT PRESET
+        "recess_effectiveness": 0.6,  # DEFAULT ADVANCED PARAMETER
+        "_initialized": True,
+    })
+
+@st.cache_resource
+def _load_logo():
+    """
+    READ THE LOGO FILE ONCE PER SERVER PROCESS. RETURNS THE RAW PNG BYTES, OR None IF MISSING.
+    (ENCODED BYTES GO STRAIGHT TO THE MEDIA STORE; A PIL IMAGE WOULD BE RE-ENCODED EVERY RERUN.)
+    """
+    try:
+        return Path("image.png").read_bytes()
+    except FileNotFoundError:
+        return None
 
 # BRANDING - LOGO IN TOP RIGHT CORNER
 col_title, col_logo = st.columns([4, 1])
@@ -338,10 +124,9 @@ with col_title:
     to match NFRC reference values.
     """)
 with col_logo:
-    try:
-        st.image("image.png", width=150)
-    except:
-        pass  # IF IMAGE NOT FOUND, CONTINUE WITHOUT IT
+    logo = _load_logo()
+    if logo is not None:  # IF IMAGE NOT FOUND, CONTINUE WITHOUT IT
+        st.image(logo, width=150)
 
 col1, col2 = st.columns(2)
 
@@ -441,36 +226,88 @@ with col2:
     recess_fraction = st.slider("Recess Fraction", 0.0, 1.0, 0.0, 0.1,
                                 help="0.0 = no recess, 1.0 = fully recessed")
 
-# INITIALIZE ADVANCED PARAMETERS
-if "recess_effectiveness" not in st.session_state:
-    st.session_state.recess_effectiveness = 0.6  # DEFAULT VALUE
-recess_effectiveness = st.session_state.recess_effectiveness
+# ADVANCED SETTINGS - ONLY SHOW WHEN CUSTOM IS SELECTED
+if st.session_state.current_preset == "Custom":
+    with st.expander("Advanced Settings (NFRC Reference Data)", expanded=True):
+        col3, col4 = st.columns(2)
+        with col3:
+            ref_u_unit = st.selectbox("Reference U-Value Unit", ["BTU", "W"], index=0 if st.session_state.ref_u_unit == "BTU" else 1)
+            
+            # UPDATE SESSION STATE WHEN UNIT CHANGES
+            st.session_state.ref_u_unit = ref_u_unit
+            if ref_u_unit != st.session_state.ref_u_unit_prev:
+                st.session_state.ref_u_unit_prev = ref_u_unit
+            
+        # ONE (KEY, LABEL, COLUMN) SPEC PER REFERENCE VALUE, STORED IN METRIC AS f"{key}_metric"
+        ref_specs = (
+            ("ref_glass_u1", "Reference Glass U1", col3),
+            ("ref_total_u1", "Reference Total U1", col3),
+            ("ref_glass_u2", "Reference Glass U2", col4),
+            ("ref_total_u2", "Reference Total U2", col4),
+        )
+        # RESOLVE THE UNIT CONVERSION ONCE FOR ALL FOUR INPUTS
+        metric_scale = U_TO_METRIC[ref_u_unit]
+        display_scale = 1.0 / metric_scale
+        for key, label, col in ref_specs:
+            metric_key = f"{key}_metric"
+            with col:
+                # USE KEY THAT INCLUDES UNIT SO WIDGET RESETS WHEN UNIT CHANGES
+                ref_value = st.number_input(
+                    label,
+                    value=st.session_state[metric_key] * display_scale,
+                    step=0.01,
+                    key=f"{key}_input_{ref_u_unit}",
+                )
+                # UPDATE STORED VALUE WHEN USER CHANGES INPUT
+                st.session_state[metric_key] = ref_value * metric_scale
+        
+        st.markdown("---")
+        recess_effectiveness = st.slider("Recess Effectiveness", 0.0, 1.0, st.session_state.recess_effectiveness, 0.1,
+                                         help="How strongly recess lowers frame U-value")
+        st.session_state.recess_effectiveness = recess_effectiveness
+    
+    # CHECK IF CURRENT VALUES MATCH ANY PRESET AND UPDATE PRESET SELECTION (AFTER ADVANCED SETTINGS UPDATES)
+    matched_preset = check_preset_match(
+        st.session_state.ref_glass_u1_metric,
+        st.session_state.ref_total_u1_metric,
+        st.session_state.ref_glass_u2_metric,
+        st.session_state.ref_total_u2_metric
+    )
+    st.session_state.current_preset = matched_preset
+else:
+    # WHEN USING A PRESET, USE DEFAULT RECESS EFFECTIVENESS FROM SESSION STATE
+    recess_effectiveness = st.session_state.recess_effectiveness
 
-# GET REFERENCE U-VALUES FROM SESSION STATE, CONVERTED TO CURRENT UNIT
-ref_u_unit = st.session_state.ref_u_unit
-ref_glass_u1 = u_to_btu(st.session_state.ref_glass_u1_metric) if ref_u_unit == "BTU" else st.session_state.ref_glass_u1_metric
-ref_total_u1 = u_to_btu(st.session_state.ref_total_u1_metric) if ref_u_unit == "BTU" else st.session_state.ref_total_u1_metric
-ref_glass_u2 = u_to_btu(st.session_state.ref_glass_u2_metric) if ref_u_unit == "BTU" else st.session_state.ref_glass_u2_metric
-ref_total_u2 = u_to_btu(st.session_state.ref_total_u2_metric) if ref_u_unit == "BTU" else st.session_state.ref_total_u2_metric
+# CANONICAL INPUTS (mm, W/m²K) - ALSO THE KEY FOR REUSING THE LAST RESULT.
+# BUILT AFTER ADVANCED SETTINGS SO THE KEY SEES THIS RERUN'S REFERENCE VALUES
+calc_inputs = dict(
+    width_mm=st.session_state.width_mm,
+    height_mm=st.session_state.height_mm,
+    glass_u_metric=st.session_state.glass_u_metric,
+    panels=panels,
+    U_glass1_metric=st.session_state.ref_glass_u1_metric,
+    U_total1_metric=st.session_state.ref_total_u1_metric,
+    U_glass2_metric=st.session_state.ref_glass_u2_metric,
+    U_total2_metric=st.session_state.ref_total_u2_metric,
+    recess_fraction=recess_fraction,
+    recess_effectiveness=recess_effectiveness,
+)
+calc_key = tuple(calc_inputs.values())
+last_result = st.session_state.get("last_result")
+# LAST RESULT STAYS VALID (AND VISIBLE) UNTIL ONE OF THE INPUTS CHANGES
+last_result_valid = last_result is not None and last_result[0] == calc_key
 
 # CALCULATE BUTTON
-if st.button("Calculate U-Value", type="primary"):
+calculate_clicked = st.button("Calculate U-Value", type="primary")
+if calculate_clicked or last_result_valid:
     try:
-        result = estimate_u_value(
-            width=width,
-            height=height,
-            size_unit=size_unit,
-            glass_u=glass_u,
-            glass_u_unit=glass_u_unit,
-            panels=panels,
-            ref_glass_u1=ref_glass_u1,
-            ref_total_u1=ref_total_u1,
-            ref_glass_u2=ref_glass_u2,
-            ref_total_u2=ref_total_u2,
-            ref_u_unit=ref_u_unit,
-            recess_fraction=recess_fraction,
-            recess_effectiveness=recess_effectiveness,
-        )
+        if last_result_valid:
+            # SAME INPUTS AS THE LAST CALCULATION - REUSE WITHOUT RECOMPUTING
+            result = last_result[1]
+        else:
+            # PASS STORED CANONICAL VALUES (mm, W/m²K) DIRECTLY - NO UNIT ROUND-TRIP
+            result = estimate_u_value_mm(**calc_inputs)
+            st.session_state["last_result"] = (calc_key, result)
         
         # DISPLAY RESULTS
         st.success("Calculation Complete!")
@@ -497,61 +334,88 @@ if st.button("Calculate U-Value", type="primary"):
         st.error(f"Error: {str(e)}")
         st.exception(e)
 
-# ADVANCED SETTINGS - ONLY SHOW WHEN CUSTOM IS SELECTED
-if st.session_state.current_preset == "Custom":
-    with st.expander("Advanced Settings (NFRC Reference Data)", expanded=True):
-        col3, col4 = st.columns(2)
-        with col3:
-            ref_u_unit = st.selectbox("Reference U-Value Unit", ["BTU", "W"], index=0 if st.session_state.ref_u_unit == "BTU" else 1)
-            
-            # UPDATE SESSION STATE WHEN UNIT CHANGES
-            st.session_state.ref_u_unit = ref_u_unit
-            if ref_u_unit != st.session_state.ref_u_unit_prev:
-                st.session_state.ref_u_unit_prev = ref_u_unit
-            
-            # CONVERT STORED VALUES TO CURRENT UNIT FOR DISPLAY
-            ref_glass_u1_display = u_to_btu(st.session_state.ref_glass_u1_metric) if ref_u_unit == "BTU" else st.session_state.ref_glass_u1_metric
-            ref_total_u1_display = u_to_btu(st.session_state.ref_total_u1_metric) if ref_u_unit == "BTU" else st.session_state.ref_total_u1_metric
-            
-            # USE KEY THAT INCLUDES UNIT SO WIDGET RESETS WHEN UNIT CHANGES
-            ref_glass_u1 = st.number_input("Reference Glass U1", value=ref_glass_u1_display, step=0.01, key=f"ref_glass_u1_input_{ref_u_unit}")
-            # UPDATE STORED VALUE WHEN USER CHANGES INPUT
-            st.session_state.ref_glass_u1_metric = u_to_metric(ref_glass_u1, ref_u_unit)
-            
-            ref_total_u1 = st.number_input("Reference Total U1", value=ref_total_u1_display, step=0.01, key=f"ref_total_u1_input_{ref_u_unit}")
-            # UPDATE STORED VALUE WHEN USER CHANGES INPUT
-            st.session_state.ref_total_u1_metric = u_to_metric(ref_total_u1, ref_u_unit)
-            
-        with col4:
-            # CONVERT STORED VALUES TO CURRENT UNIT FOR DISPLAY
-            ref_glass_u2_display = u_to_btu(st.session_state.ref_glass_u2_metric) if ref_u_unit == "BTU" else st.session_state.ref_glass_u2_metric
-            ref_total_u2_display = u_to_btu(st.session_state.ref_total_u2_metric) if ref_u_unit == "BTU" else st.session_state.ref_total_u2_metric
-            
-            # USE KEY THAT INCLUDES UNIT SO WIDGET RESETS WHEN UNIT CHANGES
-            ref_glass_u2 = st.number_input("Reference Glass U2", value=ref_glass_u2_display, step=0.01, key=f"ref_glass_u2_input_{ref_u_unit}")
-            # UPDATE STORED VALUE WHEN USER CHANGES INPUT
-            st.session_state.ref_glass_u2_metric = u_to_metric(ref_glass_u2, ref_u_unit)
-            
-            ref_total_u2 = st.number_input("Reference Total U2", value=ref_total_u2_display, step=0.01, key=f"ref_total_u2_input_{ref_u_unit}")
-            # UPDATE STORED VALUE WHEN USER CHANGES INPUT
-            st.session_state.ref_total_u2_metric = u_to_metric(ref_total_u2, ref_u_unit)
-        
-        st.markdown("---")
-        recess_effectiveness = st.slider("Recess Effectiveness", 0.0, 1.0, st.session_state.recess_effectiveness, 0.1,
-                                         help="How strongly recess lowers frame U-value")
-        st.session_state.recess_effectiveness = recess_effectiveness
-    
-    # CHECK IF CURRENT VALUES MATCH ANY PRESET AND UPDATE PRESET SELECTION (AFTER ADVANCED SETTINGS UPDATES)
-    matched_preset = check_preset_match(
-        st.session_state.ref_glass_u1_metric,
-        st.session_state.ref_total_u1_metric,
-        st.session_state.ref_glass_u2_metric,
-        st.session_state.ref_total_u2_metric
-    )
-    st.session_state.current_preset = matched_preset
-else:
-    # WHEN USING A PRESET, USE DEFAULT RECESS EFFECTIVENESS FROM SESSION STATE
-    recess_effectiveness = st.session_state.recess_effectiveness
+@st.cache_data(max_entries=64, show_spinner=False)
+def _compute_sweep_curves(
+    x_min,
+    x_max,
+    num_points,
+    vary_dimension,
+    unit_factor_mm,
+    fixed_dim_mm,
+    glass_u_metric,
+    U_glass1_metric,
+    U_total1_metric,
+    U_glass2_metric,
+    U_total2_metric,
+    recess_fraction,
+    recess_effectiveness,
+    panel_counts=(2, 3, 4),
+):
+    """
+    MEMOIZED SENSITIVITY SWEEP. ALL ARGUMENTS ARE SCALARS SO THE CACHE KEY IS CHEAP.
+    RETURNS (x_values IN DISPLAY UNITS, U-VALUES IN BTU WITH ONE ROW PER PANEL COUNT).
+    """
+    x_values = np.linspace(x_min, x_max, num_points)
+    x_mm = x_values * unit_factor_mm
+    if vary_dimension == "Width":
+        widths_mm, heights_mm = x_mm, fixed_dim_mm
+    else:
+        widths_mm, heights_mm = fixed_dim_mm, x_mm
+
+    # ONE SWEEP CALL EVALUATES EVERY PANEL COUNT EXACTLY, ONE ROW EACH
+    curves_btu = u_to_btu(estimate_u_value_sweep(
+        widths_mm, heights_mm, glass_u_metric,
+        panel_counts=panel_counts,
+        U_glass1_metric=U_glass1_metric,
+        U_total1_metric=U_total1_metric,
+        U_glass2_metric=U_glass2_metric,
+        U_total2_metric=U_total2_metric,
+        recess_fraction=recess_fraction,
+        recess_effectiveness=recess_effectiveness,
+    ))
+    return x_values, curves_btu
+
+# SENSITIVITY SWEEP - U-VALUE VS. SIZE FOR 2/3/4 PANELS
+# RUNS AFTER ADVANCED SETTINGS SO IT PLOTS THIS RERUN'S REFERENCE VALUES
+with st.expander("U-Value Sensitivity", expanded=False):
+    # THE EXPANDER BODY RUNS EVEN WHEN COLLAPSED - ONLY BUILD THE CHART ON REQUEST
+    if st.toggle("Show Sensitivity Chart", value=False):
+        vary_dimension = st.radio("Vary Dimension", ["Width", "Height"], horizontal=True)
+        num_points = st.slider("Number of Points", 10, 200, 50, 10)
+
+        # SWEEP FROM HALF TO DOUBLE THE CURRENT SIZE (HEIGHT CAPPED AT 6M)
+        if vary_dimension == "Width":
+            x_min, x_max = max(0.1, width * 0.5), width * 2.0
+            fixed_dim_mm = st.session_state.height_mm
+        else:
+            x_min, x_max = max(0.1, height * 0.5), min(height * 2.0, max_height_display)
+            fixed_dim_mm = st.session_state.width_mm
+
+        # CACHED ON SCALAR INPUTS - REVERTING A WIDGET RETURNS THE PREVIOUS CURVES INSTANTLY
+        sweep_panels = (2, 3, 4)
+        x_values, curves_btu = _compute_sweep_curves(
+            x_min,
+            x_max,
+            num_points,
+            vary_dimension,
+            LENGTH_TO_MM[size_unit],  # RESOLVE THE UNIT ONCE; THE SWEEP ONLY SEES mm
+            fixed_dim_mm,
+            st.session_state.glass_u_metric,
+            st.session_state.ref_glass_u1_metric,
+            st.session_state.ref_total_u1_metric,
+            st.session_state.ref_glass_u2_metric,
+            st.session_state.ref_total_u2_metric,
+            recess_fraction,
+            recess_effectiveness,
+            panel_counts=sweep_panels,
+        )
+
+        # BUILD ALL SERIES IN ONE MAPPING AND HAND THEM TO A SINGLE CHART CALL
+        x_label = f"{vary_dimension} ({size_unit})"
+        series_labels = [f"{n} Panels" for n in sweep_panels]
+        chart_data = {x_label: x_values, **dict(zip(series_labels, curves_btu))}
+        st.line_chart(chart_data, x=x_label, y=series_labels)
+        st.caption("U-Value (BTU/hr·ft²·°F)")
 
 # DOCUMENTATION SECTION
 with st.expander("Calculation Methodology & Parameters", expanded=False):
@@ -561,11 +425,12 @@ with st.expander("Calculation Methodology & Parameters", expanded=False):
     **Based on Ground Truth:**
     - Calibrated to NFRC reference data (2 m × 2 m door: 0.25 BTU glass → 0.41 BTU total, 0.30 BTU glass → 0.46 BTU total)
     - Glass U-value input from manufacturer specifications
-    - Frame and edge U-values are back-calculated from these reference cases
+    - Frame and edge U-values are back-calculated from these reference cases: the references fix the combined frame + edge heat loss, which is split by assuming `U_edge = 1.2 × U_frame`
     
     **Estimated/Empirical:**
     - Frame width: Estimated as `0.015 × √(perimeter)`, constrained to 40-100 mm
-    - Edge zone: Estimated as `0.010 × √(perimeter)`, constrained to 30-80 mm
+    - Edge zone: Estimated as `0.010 × √(perimeter)`, constrained to 30-80 mm, measured inward from the glass sightline
+    - Edge-to-frame ratio: `U_edge / U_frame = 1.2` is an assumed spacer penalty (the references alone cannot separate frame and edge)
     - Size scaling: Larger units perform better via `exp(-0.06 × (size_factor - 1.0))`
     - Aspect ratio: Non-square doors penalized by `1.0 + 0.02 × |aspect_ratio - 1.0|`
     - Recess effectiveness: Default 0.6 (60% reduction when fully recessed) is estimated
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Regression checks for the numeric model in uvalue_core."""
+
+import numpy as np
+import pytest
+
+from uvalue_core import (
+    BTU_TO_W,
+    estimate_u_value,
+    estimate_u_value_batch,
+    estimate_u_value_mm,
+    estimate_u_value_sweep,
+)
+
+SIZES_MM = [(2000.0, 2000.0), (3657.6, 2743.2), (7315.2, 3657.6), (900.0, 2400.0), (12000.0, 5900.0)]
+CERO2_REFS_METRIC = dict(
+    U_glass1_metric=0.25 * BTU_TO_W,
+    U_total1_metric=0.41 * BTU_TO_W,
+    U_glass2_metric=0.30 * BTU_TO_W,
+    U_total2_metric=0.48 * BTU_TO_W,
+)
+
+
+def test_reference_door_calibration():
+    # 2 m x 2 m NFRC reference: 0.25 -> 0.41 BTU, 0.30 -> 0.46 BTU
+    assert estimate_u_value(2, 2, "m", 0.25)["U_btu"] == pytest.approx(0.41, abs=0.005)
+    assert estimate_u_value(2, 2, "m", 0.30)["U_btu"] == pytest.approx(0.46, abs=0.005)
+
+
+def test_legacy_debug_sizes_in_caller_unit():
+    debug = estimate_u_value(24, 12, "ft", 0.30, panels=4)["debug"]
+    assert debug["scaled_width"] == pytest.approx(12.0)
+    assert debug["scaled_height"] == pytest.approx(12.0)
+    assert "scaled_width_mm" not in debug
+
+
+@pytest.mark.parametrize("width_mm, height_mm", SIZES_MM)
+def test_area_partition_is_positive(width_mm, height_mm):
+    areas = estimate_u_value_mm(width_mm, height_mm, 0.30 * BTU_TO_W)["areas_m2"]
+    assert areas["A_frame"] > 0.0
+    assert areas["A_edge"] > 0.0
+    assert areas["A_glass"] + areas["A_edge"] + areas["A_frame"] == pytest.approx(areas["A_total"])
+
+
+@pytest.mark.parametrize("width_mm, height_mm", SIZES_MM)
+@pytest.mark.parametrize("panels", [1, 2, 3, 4])
+@pytest.mark.parametrize("glass_u_btu", [0.12, 0.25, 0.30, 0.45])
+def test_recess_never_raises_u(width_mm, height_mm, panels, glass_u_btu):
+    u_values = [
+        estimate_u_value_mm(
+            width_mm, height_mm, glass_u_btu * BTU_TO_W, panels=panels,
+            recess_fraction=recess_fraction, full_output=False, **CERO2_REFS_METRIC,
+        )
+        for recess_fraction in np.linspace(0.0, 1.0, 11)
+    ]
+    assert np.all(np.diff(u_values) <= 0.0)
+
+
+@pytest.mark.parametrize("panels", [1, 2, 3, 4, 6])
+@pytest.mark.parametrize("recess_fraction", [0.0, 0.5, 1.0])
+@pytest.mark.parametrize("edge_to_frame_ratio", [1.0, 1.2, 1.5])
+def test_batch_matches_scalar_core(panels, recess_fraction, edge_to_frame_ratio):
+    widths_mm = np.linspace(500.0, 12000.0, 25)
+    options = dict(
+        recess_fraction=recess_fraction,
+        edge_to_frame_ratio=edge_to_frame_ratio,
+        **CERO2_REFS_METRIC,
+    )
+    for height_mm in (1500.0, 2743.2, 5900.0):
+        batch = estimate_u_value_batch(widths_mm, height_mm, 1.7, panels, **options)
+        scalar = [
+            estimate_u_value_mm(width_mm, height_mm, 1.7, panels, full_output=False, **options) * BTU_TO_W
+            for width_mm in widths_mm
+        ]
+        np.testing.assert_allclose(batch, scalar, rtol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "widths_mm, heights_mm, panel_counts",
+    [
+        (np.linspace(500.0, 12000.0, 41), 2743.2, (1, 2, 3, 4, 5)),
+        (2000.0, np.linspace(1000.0, 5900.0, 17), (2, 3, 4)),
+        (3657.6, 2743.2, (2, 3, 4)),  # scalar sizes -> one point
+        (np.linspace(500.0, 12000.0, 9), 2000.0, np.array([2, 3, 4, 5])[::2]),  # strided
+    ],
+)
+def test_sweep_matches_batch(widths_mm, heights_mm, panel_counts):
+    sweep = estimate_u_value_sweep(widths_mm, heights_mm, 1.7, panel_counts, recess_fraction=0.3)
+    batch = estimate_u_value_batch(
+        widths_mm, heights_mm, 1.7, np.asarray(panel_counts)[:, None], recess_fraction=0.3,
+    )
+    n_points = np.broadcast(np.atleast_1d(widths_mm), np.atleast_1d(heights_mm)).shape[0]
+    assert sweep.shape == (len(panel_counts), n_points)
+    np.testing.assert_allclose(sweep, np.broadcast_to(batch, sweep.shape), rtol=1e-9)
@@ -0,0 +1,563 @@
+# -*- coding: utf-8 -*-
+"""
+Numeric model behind the U-value estimator (no Streamlit).
+
+Unit conversions, the size-dependent geometry, the frame/edge back-calculation
+and the single / batch / sweep estimators. Importing this module has no side
+effects beyond compiling (or loading) the optional Numba kernels, so it can be
+used from scripts and tests as well as from app.py.
+
+Numba is optional (see requirements.txt): when it is installed the scalar
+core and the sweep run as compiled kernels, otherwise the same functions
+run as plain Python / NumPy.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # NUMBA IS OPTIONAL - FALL BACK TO PLAIN PYTHON
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+BTU_TO_W = 5.678  # BTU/hr·ft²·°F -> W/m²K
+EDGE_TO_FRAME_RATIO = 1.2  # U_edge / U_frame, typical NFRC spacer penalty
+
+# SIZE / ASPECT CORRECTION PARAMETERS (MODULE CONSTANTS SO NUMBA FOLDS THEM)
+_REF_AREA_MM2 = 2000.0 * 2000.0  # 2m x 2m NFRC reference door
+_ASPECT_COEFF = 0.02  # penalty per unit of |aspect_ratio - 1|
+_SIZE_COEFF = -0.06  # exponential gain for larger units
+
+# UNIT FACTORS. KEYS ARE THE CANONICAL SPELLINGS USED BY THE UI SELECTBOXES.
+LENGTH_TO_MM = {"mm": 1.0, "m": 1000.0, "ft": 304.8, "in": 25.4}
+MM_TO_LENGTH = {unit: 1.0 / factor for unit, factor in LENGTH_TO_MM.items()}
+U_TO_METRIC = {"W": 1.0, "BTU": BTU_TO_W}
+
+def length_to_mm(value: float, unit: str) -> float:
+    """
+    Convert a length to mm.
+    unit: "mm", "m", "ft", "in" (lowercase, as returned by the size selectbox)
+    """
+    try:
+        return value * LENGTH_TO_MM[unit]
+    except KeyError:
+        raise ValueError(f"Unsupported length unit: {unit}") from None
+
+def mm_to_length(value_mm: float, unit: str) -> float:
+    """
+    Convert a length from mm to specified unit.
+    unit: "mm", "m", "ft", "in" (lowercase, as returned by the size selectbox)
+    """
+    try:
+        return value_mm * MM_TO_LENGTH[unit]
+    except KeyError:
+        raise ValueError(f"Unsupported length unit: {unit}") from None
+
+def u_to_metric(u_value: float, unit: str) -> float:
+    """
+    Convert U-value to W/m²K.
+    unit: "BTU" for BTU/hr·ft²·°F, "W" for W/m²K (exact spelling, as returned by the selectbox)
+    """
+    try:
+        return u_value * U_TO_METRIC[unit]
+    except KeyError:
+        raise ValueError(f"Unsupported U-value unit: {unit}") from None
+
+def u_to_btu(u_value_metric: float) -> float:
+    """Convert U-value from W/m²K to BTU/hr·ft²·°F."""
+    return u_value_metric / BTU_TO_W
+
+@njit("UniTuple(f8, 2)(f8, f8)", cache=True)
+def dynamic_frame_and_edge(width_mm: float, height_mm: float):
+    """
+    Estimate effective frame width and edge-of-glass zone thickness
+    as a function of size. Tuned empirically.
+    """
+    perimeter_mm = 2.0 * (width_mm + height_mm)
+    sqrt_perimeter = math.sqrt(perimeter_mm)
+
+    # Frame width grows slowly with size but stays in a realistic band
+    frame_width_mm = max(40.0, min(100.0, 0.015 * sqrt_perimeter))
+
+    # Edge zone (degraded glass near spacer) also scales mildly
+    edge_zone_mm = max(30.0, min(80.0, 0.010 * sqrt_perimeter))
+
+    return frame_width_mm, edge_zone_mm
+
+if not HAS_NUMBA:
+    # PURE-PYTHON FALLBACK: MEMOIZE REPEATED SIZES (UNDER NUMBA THE CORE INLINES IT)
+    dynamic_frame_and_edge = functools.lru_cache(maxsize=1024)(dynamic_frame_and_edge)
+
+def solve_frame_and_edge_u(
+    U_glass1_metric: float,
+    U_total1_metric: float,
+    U_glass2_metric: float,
+    U_total2_metric: float,
+    A_glass: float,
+    A_frame: float,
+    A_edge: float,
+    edge_to_frame_ratio: float = EDGE_TO_FRAME_RATIO,
+):
+    """
+    Solve for frame and edge U-values using two NFRC reference cases.
+
+    We assume the *area partition* (A_glass, A_frame, A_edge) for the base door
+    is representative of the system. The two reference totals only constrain the
+    combined frame + edge heat loss, so U_edge is tied to U_frame by a fixed
+    ratio (edge_to_frame_ratio) to close the system.
+    """
+    A_total = A_glass + A_frame + A_edge
+
+    # System:
+    # U_total1 * A_total = A_g * U_g1 + A_f * U_f + A_e * U_e
+    # U_total2 * A_total = A_g * U_g2 + A_f * U_f + A_e * U_e
+    # Both rows share the same frame/edge terms, so they only pin down
+    # C = A_f * U_f + A_e * U_e. Average the two references for C and
+    # close with U_e = k * U_f. The reference-only means are scalars, so a
+    # sweep over areas only pays for the area-dependent products.
+    U_total_mean = 0.5 * (U_total1_metric + U_total2_metric)
+    U_glass_mean = 0.5 * (U_glass1_metric + U_glass2_metric)
+    C = U_total_mean * A_total - U_glass_mean * A_glass
+
+    U_frame_metric = C / (A_frame + edge_to_frame_ratio * A_edge)
+    U_edge_metric = edge_to_frame_ratio * U_frame_metric
+    return U_frame_metric, U_edge_metric
+
+# EXPLICIT SIGNATURES COMPILE (OR LOAD FROM THE ON-DISK CACHE) AT IMPORT,
+# SO THE FIRST CLICK / FIRST SWEEP DOES NOT PAY THE LLVM COMPILE
+@njit("UniTuple(f8, 12)(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _estimate_u_core(
+    width_mm: float,
+    height_mm: float,
+    U_glass_metric: float,
+    U_glass1_metric: float,
+    U_total1_metric: float,
+    U_glass2_metric: float,
+    U_total2_metric: float,
+    recess_fraction: float,
+    recess_effectiveness: float,
+    edge_to_frame_ratio: float,
+):
+    """
+    Numeric core of estimate_u_value on plain floats (mm, W/m²K).
+
+    Kept free of strings and dicts so it can be JIT-compiled by Numba.
+
+    Returns:
+        tuple of (U_final_metric, A_total, A_glass, A_edge, A_frame,
+        U_frame_metric, U_edge_metric, U_frame_adj_metric,
+        frame_width_mm, edge_zone_mm, aspect_ratio, size_factor)
+    """
+    # ---- 1. Geometry & areas ----
+    frame_width_mm, edge_zone_mm = dynamic_frame_and_edge(width_mm, height_mm)
+
+    A_total = (width_mm * height_mm) / 1e6  # mm² -> m²
+
+    # Glass opening a x b (sightline to sightline)
+    opening_w_mm = width_mm - 2 * frame_width_mm
+    opening_h_mm = height_mm - 2 * frame_width_mm
+
+    # Edge-of-glass band lies on the glass side of the sightline, so glass,
+    # edge and frame partition the door and A_frame stays positive:
+    # ab - (a - 2e)(b - 2e) = e * (2(a + b) - 4e)
+    A_glass = ((opening_w_mm - 2 * edge_zone_mm) *
+               (opening_h_mm - 2 * edge_zone_mm)) / 1e6
+    inner_perimeter_mm = 2.0 * (opening_w_mm + opening_h_mm)
+    A_edge = max(0.0, edge_zone_mm * (inner_perimeter_mm - 4.0 * edge_zone_mm)) / 1e6
+
+    A_frame = A_total - A_glass - A_edge
+
+    # Back-calc frame/edge U-values (solve_frame_and_edge_u, inlined for Numba)
+    C = (
+        0.5 * (U_total1_metric + U_total2_metric) * A_total -
+        0.5 * (U_glass1_metric + U_glass2_metric) * A_glass
+    )
+    U_frame_metric = C / (A_frame + edge_to_frame_ratio * A_edge)
+    U_edge_metric = edge_to_frame_ratio * U_frame_metric
+
+    # ---- 2. Apply frame recess adjustment ----
+    recess_fraction = max(0.0, min(1.0, recess_fraction))
+    recess_effectiveness = max(0.0, min(1.0, recess_effectiveness))
+
+    U_frame_adj_metric = U_frame_metric * (1.0 - recess_fraction * recess_effectiveness)
+
+    # ---- 3. Area-weighted base U ----
+    U_weighted_metric = (
+        U_glass_metric * A_glass +
+        U_edge_metric * A_edge +
+        U_frame_adj_metric * A_frame
+    ) / A_total
+
+    # ---- 4. Non-linear size + aspect ratio correction ----
+    aspect_ratio = height_mm / max(width_mm, 1e-3)
+    size_factor = (width_mm * height_mm) / _REF_AREA_MM2  # vs 2m x 2m base
+
+    # Aspect ratio penalty
+    aspect_factor = 1.0 + _ASPECT_COEFF * abs(aspect_ratio - 1.0)
+
+    # Larger units perform better
+    size_factor_correction = math.exp(_SIZE_COEFF * (size_factor - 1.0))
+
+    U_final_metric = U_weighted_metric * aspect_factor * size_factor_correction
+
+    return (
+        U_final_metric,
+        A_total, A_glass, A_edge, A_frame,
+        U_frame_metric, U_edge_metric, U_frame_adj_metric,
+        frame_width_mm, edge_zone_mm,
+        aspect_ratio, size_factor,
+    )
+
+def estimate_u_value_mm(
+    width_mm: float,
+    height_mm: float,
+    glass_u_metric: float,
+    panels: int = 2,
+    # NFRC reference data (W/m²K) for a 2000 x 2000 mm door:
+    U_glass1_metric: float = 0.25 * BTU_TO_W,
+    U_total1_metric: float = 0.41 * BTU_TO_W,
+    U_glass2_metric: float = 0.30 * BTU_TO_W,
+    U_total2_metric: float = 0.46 * BTU_TO_W,
+    # Frame recess parameters:
+    recess_fraction: float = 0.0,   # 0.0 = no recess, 1.0 = fully recessed
+    recess_effectiveness: float = 0.6,  # how strongly recess lowers frame U
+    edge_to_frame_ratio: float = EDGE_TO_FRAME_RATIO,  # U_edge / U_frame closure
+    full_output: bool = True,  # False -> return only the U-value in BTU
+):
+    """
+    Estimate assembly U-value for a glazed door from canonical units.
+
+    Same as estimate_u_value, but sizes are in mm and all U-values in W/m²K,
+    so no unit conversion is done. The Streamlit layer calls this directly
+    with the values it keeps in session_state.
+
+    Returns:
+        dict, as estimate_u_value (debug sizes reported in mm), or the
+        unrounded U-value in BTU/hr·ft²·°F as a float if full_output is False
+    """
+
+    # ---- 0. SCALE FOR MULTI-PANEL SYSTEMS ----
+    # IF MORE THAN 2 PANELS, SCALE WIDTH ONLY TO 2-PANEL EQUIVALENT
+    if panels > 2:
+        width_mm = width_mm * (2.0 / panels)
+        # HEIGHT REMAINS UNCHANGED
+
+    # ---- 1. Geometry, back-calc, recess & size corrections ----
+    (
+        U_final_metric,
+        A_total, A_glass, A_edge, A_frame,
+        U_frame_metric, U_edge_metric, U_frame_adj_metric,
+        frame_width_mm, edge_zone_mm,
+        aspect_ratio, size_factor,
+    ) = _estimate_u_core(
+        width_mm, height_mm, glass_u_metric,
+        U_glass1_metric, U_total1_metric,
+        U_glass2_metric, U_total2_metric,
+        recess_fraction, recess_effectiveness,
+        edge_to_frame_ratio,
+    )
+    U_final_btu = u_to_btu(U_final_metric)
+
+    # FAST PATH FOR SWEEPS / SCRIPTS THAT ONLY NEED THE NUMBER
+    if not full_output:
+        return float(U_final_btu)
+
+    return {
+        "U_metric": float(round(U_final_metric, 3)),
+        "U_btu": float(round(U_final_btu, 3)),
+
+        "areas_m2": {
+            "A_total": float(A_total),
+            "A_glass": float(A_glass),
+            "A_edge": float(A_edge),
+            "A_frame": float(A_frame),
+        },
+
+        "U_components_metric": {
+            "U_glass": float(glass_u_metric),
+            "U_edge": float(round(U_edge_metric, 3)),
+            "U_frame_raw": float(round(U_frame_metric, 3)),
+            "U_frame_adjusted": float(round(U_frame_adj_metric, 3)),
+        },
+
+        "debug": {
+            "aspect_ratio": float(aspect_ratio),
+            "size_factor": float(size_factor),
+            "frame_width_mm": float(frame_width_mm),
+            "edge_zone_mm": float(edge_zone_mm),
+            "scaled_width_mm": float(width_mm),
+            "scaled_height_mm": float(height_mm),
+            "panels": panels,
+        }
+    }
+
+def estimate_u_value(
+    width: float,
+    height: float,
+    size_unit: str,
+    glass_u: float,
+    glass_u_unit: str = "BTU",
+    panels: int = 2,
+    # NFRC reference data for a 2000 x 2000 mm door:
+    ref_glass_u1: float = 0.25,
+    ref_total_u1: float = 0.41,
+    ref_glass_u2: float = 0.30,
+    ref_total_u2: float = 0.46,
+    ref_u_unit: str = "BTU",
+    # Frame recess parameters:
+    recess_fraction: float = 0.0,   # 0.0 = no recess, 1.0 = fully recessed
+    recess_effectiveness: float = 0.6,  # how strongly recess lowers frame U
+    edge_to_frame_ratio: float = EDGE_TO_FRAME_RATIO,  # U_edge / U_frame closure
+    full_output: bool = True,  # False -> return only the U-value in BTU
+):
+    """
+    Estimate assembly U-value for a glazed door.
+
+    Thin wrapper around estimate_u_value_mm that converts the inputs first.
+
+    width, height: numeric door size
+    size_unit: "mm", "m", "ft", "in"
+    glass_u: glazing U-value (center-of-glass)
+    glass_u_unit: "BTU" or "W"
+    panels: number of panels (if > 2, scales width only by 2/panels to get 2-panel equivalent)
+    ref_glass_u1, ref_total_u1: NFRC reference for ~2m x 2m door, better glass
+    ref_glass_u2, ref_total_u2: NFRC reference for ~2m x 2m door, worse glass
+    ref_u_unit: unit for the reference U-values ("BTU" or "W")
+    recess_fraction: fraction of frame embedded in wall (0–1)
+    recess_effectiveness: how much recess reduces frame U (0–1)
+    edge_to_frame_ratio: assumed U_edge / U_frame used to split the frame + edge
+        heat loss fixed by the references
+    full_output: if False, skip building the result dict
+
+    Returns:
+        dict with:
+            - U_metric (W/m²K)
+            - U_btu (BTU/hr·ft²·°F)
+            - areas (glass/frame/edge/total)
+            - intermediate U_frame / U_edge (metric)
+            - debug info (scaled width/height in size_unit)
+        or, if full_output is False, the unrounded U-value in BTU/hr·ft²·°F
+    """
+    result = estimate_u_value_mm(
+        length_to_mm(width, size_unit),
+        length_to_mm(height, size_unit),
+        u_to_metric(glass_u, glass_u_unit),
+        panels=panels,
+        U_glass1_metric=u_to_metric(ref_glass_u1, ref_u_unit),
+        U_total1_metric=u_to_metric(ref_total_u1, ref_u_unit),
+        U_glass2_metric=u_to_metric(ref_glass_u2, ref_u_unit),
+        U_total2_metric=u_to_metric(ref_total_u2, ref_u_unit),
+        recess_fraction=recess_fraction,
+        recess_effectiveness=recess_effectiveness,
+        edge_to_frame_ratio=edge_to_frame_ratio,
+        full_output=full_output,
+    )
+    if not full_output:
+        return result
+
+    # LEGACY DEBUG KEYS: SCALED SIZES IN THE CALLER'S UNIT, NOT mm
+    debug = result["debug"]
+    result["debug"] = {
+        "aspect_ratio": debug["aspect_ratio"],
+        "size_factor": debug["size_factor"],
+        "frame_width_mm": debug["frame_width_mm"],
+        "edge_zone_mm": debug["edge_zone_mm"],
+        "scaled_width": mm_to_length(debug["scaled_width_mm"], size_unit),
+        "scaled_height": mm_to_length(debug["scaled_height_mm"], size_unit),
+        "panels": debug["panels"],
+    }
+    return result
+
+
+def estimate_u_value_batch(
+    widths_mm,
+    heights_mm,
+    glass_u_metric,
+    panels=2,
+    # NFRC reference data (W/m²K) for a 2000 x 2000 mm door:
+    U_glass1_metric: float = 0.25 * BTU_TO_W,
+    U_total1_metric: float = 0.41 * BTU_TO_W,
+    U_glass2_metric: float = 0.30 * BTU_TO_W,
+    U_total2_metric: float = 0.46 * BTU_TO_W,
+    # Frame recess parameters:
+    recess_fraction: float = 0.0,
+    recess_effectiveness: float = 0.6,
+    edge_to_frame_ratio: float = EDGE_TO_FRAME_RATIO,
+):
+    """
+    Vectorized estimate_u_value for sweeps / sensitivity plots.
+
+    widths_mm, heights_mm, glass_u_metric, panels: scalars or arrays, broadcast
+    against each other (e.g. panels of shape (3, 1) with widths of shape (N,)
+    gives a (3, N) result). Sizes are in mm and U-values in W/m²K.
+
+    Returns:
+        ndarray of assembly U-values (W/m²K)
+    """
+    widths_mm = np.asarray(widths_mm, dtype=np.float64)
+    heights_mm = np.asarray(heights_mm, dtype=np.float64)
+    panels = np.asarray(panels)
+
+    # ---- 0. SCALE FOR MULTI-PANEL SYSTEMS ----
+    width_mm = widths_mm * np.where(panels > 2, 2.0 / panels, 1.0)
+    height_mm = heights_mm
+
+    # ---- 1. Geometry & areas ----
+    sqrt_perimeter = np.sqrt(2.0 * (width_mm + height_mm))
+    frame_width_mm = np.clip(0.015 * sqrt_perimeter, 40.0, 100.0)
+    edge_zone_mm = np.clip(0.010 * sqrt_perimeter, 30.0, 80.0)
+
+    A_total = (width_mm * height_mm) / 1e6
+
+    # Same partition as _estimate_u_core: edge band inside the sightline
+    opening_w_mm = width_mm - 2 * frame_width_mm
+    opening_h_mm = height_mm - 2 * frame_width_mm
+
+    A_glass = ((opening_w_mm - 2 * edge_zone_mm) *
+               (opening_h_mm - 2 * edge_zone_mm)) / 1e6
+    inner_perimeter_mm = 2.0 * (opening_w_mm + opening_h_mm)
+    A_edge = np.maximum(0.0, edge_zone_mm * (inner_perimeter_mm - 4.0 * edge_zone_mm)) / 1e6
+
+    A_frame = A_total - A_glass - A_edge
+
+    # Closed-form solve is pure arithmetic, so it broadcasts elementwise
+    U_frame_metric, U_edge_metric = solve_frame_and_edge_u(
+        U_glass1_metric, U_total1_metric,
+        U_glass2_metric, U_total2_metric,
+        A_glass, A_frame, A_edge,
+        edge_to_frame_ratio,
+    )
+
+    # ---- 2. Frame recess adjustment ----
+    recess_fraction = max(0.0, min(1.0, recess_fraction))
+    recess_effectiveness = max(0.0, min(1.0, recess_effectiveness))
+
+    U_frame_adj_metric = U_frame_metric * (1.0 - recess_fraction * recess_effectiveness)
+
+    # ---- 3. Area-weighted base U ----
+    U_weighted_metric = (
+        glass_u_metric * A_glass +
+        U_edge_metric * A_edge +
+        U_frame_adj_metric * A_frame
+    ) / A_total
+
+    # ---- 4. Non-linear size + aspect ratio correction ----
+    aspect_ratio = height_mm / np.maximum(width_mm, 1e-3)
+    size_factor = (width_mm * height_mm) / _REF_AREA_MM2
+
+    aspect_factor = 1.0 + _ASPECT_COEFF * np.abs(aspect_ratio - 1.0)
+    size_factor_correction = np.exp(_SIZE_COEFF * (size_factor - 1.0))
+
+    return U_weighted_metric * aspect_factor * size_factor_correction
+
+
+@njit(
+    "void(f8[::1], f8[::1], i8[::1], f8, f8, f8, f8, f8, f8, f8, f8, f8[:, ::1])",
+    cache=True,
+)
+def _sweep_panels_kernel(
+    widths_mm,
+    heights_mm,
+    panel_counts,
+    glass_u_metric,
+    U_glass1_metric,
+    U_total1_metric,
+    U_glass2_metric,
+    U_total2_metric,
+    recess_fraction,
+    recess_effectiveness,
+    edge_to_frame_ratio,
+    out,
+):
+    """
+    Fill out[p, i] with the U-value (W/m²K) of door i built with panel_counts[p].
+
+    Deliberately serial: Streamlit runs every session's script in its own
+    thread, so a parallel kernel could be entered concurrently, which Numba's
+    fallback (workqueue) threading layer aborts the process on. A UI-sized
+    sweep takes tens of microseconds and is cached by the caller anyway.
+    """
+    for p in range(panel_counts.shape[0]):
+        # SAME 2-PANEL EQUIVALENT WIDTH SCALING AS estimate_u_value_mm
+        width_scale = 2.0 / panel_counts[p] if panel_counts[p] > 2 else 1.0
+        for i in range(widths_mm.shape[0]):
+            out[p, i] = _estimate_u_core(
+                widths_mm[i] * width_scale, heights_mm[i], glass_u_metric,
+                U_glass1_metric, U_total1_metric,
+                U_glass2_metric, U_total2_metric,
+                recess_fraction, recess_effectiveness,
+                edge_to_frame_ratio,
+            )[0]
+
+def estimate_u_value_sweep(
+    widths_mm,
+    heights_mm,
+    glass_u_metric: float,
+    panel_counts=(2, 3, 4),
+    # NFRC reference data (W/m²K) for a 2000 x 2000 mm door:
+    U_glass1_metric: float = 0.25 * BTU_TO_W,
+    U_total1_metric: float = 0.41 * BTU_TO_W,
+    U_glass2_metric: float = 0.30 * BTU_TO_W,
+    U_total2_metric: float = 0.46 * BTU_TO_W,
+    # Frame recess parameters:
+    recess_fraction: float = 0.0,
+    recess_effectiveness: float = 0.6,
+    edge_to_frame_ratio: float = EDGE_TO_FRAME_RATIO,
+):
+    """
+    U-values for a size sweep at several panel counts.
+
+    widths_mm, heights_mm: scalars or 1-D arrays (mm), broadcast to a common length
+    panel_counts: panel counts to compare, one output row each
+
+    Uses the compiled Numba kernel when Numba is installed, otherwise the
+    vectorized NumPy path (estimate_u_value_batch).
+
+    Returns:
+        ndarray of shape (len(panel_counts), n_points), U-values in W/m²K
+    """
+    # AT LEAST 1-D SO SCALAR SIZES GIVE ONE POINT; CONTIGUOUS int64 TO MATCH THE
+    # KERNEL SIGNATURE (A STRIDED panel_counts WOULD HAVE NO MATCHING DEFINITION)
+    widths_mm, heights_mm = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(widths_mm, dtype=np.float64)),
+        np.atleast_1d(np.asarray(heights_mm, dtype=np.float64)),
+    )
+    panel_counts = np.ascontiguousarray(panel_counts, dtype=np.int64)
+
+    if not HAS_NUMBA:
+        return estimate_u_value_batch(
+            widths_mm, heights_mm, glass_u_metric,
+            panels=panel_counts[:, None],
+            U_glass1_metric=U_glass1_metric,
+            U_total1_metric=U_total1_metric,
+            U_glass2_metric=U_glass2_metric,
+            U_total2_metric=U_total2_metric,
+            recess_fraction=recess_fraction,
+            recess_effectiveness=recess_effectiveness,
+            edge_to_frame_ratio=edge_to_frame_ratio,
+        )
+
+    out = np.empty((panel_counts.shape[0], widths_mm.shape[0]), dtype=np.float64)
+    _sweep_panels_kernel(
+        np.ascontiguousarray(widths_mm),
+        np.ascontiguousarray(heights_mm),
+        panel_counts,
+        float(glass_u_metric),
+        float(U_glass1_metric),
+        float(U_total1_metric),
+        float(U_glass2_metric),
+        float(U_total2_metric),
+        float(recess_fraction),
+        float(recess_effectiveness),
+        float(edge_to_frame_ratio),
+        out,
+    )
+    return out